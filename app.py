@@ -1,30 +1,15 @@
 # app.py
 import streamlit as st
-import pickle
-import re
+import array
+import string
 from datetime import datetime
+from spam_core import clean_text, load_artifacts, predict, warm_up
 
 # Page config
 st.set_page_config(page_title="SMS Spam Classifier", page_icon="📨", layout="centered")
 
 # ---------- Safe load ----------
-@st.cache_resource
-def load_files():
-    try:
-        with open("tfidf_vectorizer.pkl", "rb") as f:
-            vectorizer = pickle.load(f)
-    except Exception as e:
-        return None, None, f"Error loading tfidf_vectorizer.pkl: {e}"
-
-    try:
-        with open("spam_model.pkl", "rb") as f:
-            model = pickle.load(f)
-    except Exception as e:
-        return None, None, f"Error loading spam_model.pkl: {e}"
-
-    return vectorizer, model, None
-
-vectorizer, model, load_error = load_files()
+_, _, load_error = load_artifacts()
 
 # ---------- Error if model missing ----------
 if load_error:
@@ -33,28 +18,34 @@ if load_error:
     st.caption(load_error)
     st.stop()
 
-# ---------- Helpers ----------
-def clean_text(text):
-    text = text.lower().strip()
-    text = re.sub(r"\s+", " ", text)
-    return text
-
-def classify(text):
-    x = vectorizer.transform([clean_text(text)])
-    pred = model.predict(x)[0]
-    # normalize type
-    if isinstance(pred, (int, float)):
-        pred = "spam" if int(pred) == 1 else "ham"
-    else:
-        pred = pred.lower()
+warm_up()
+
+# ---------- Session state ----------
+NO_SCORE = 255
+
+def _pct(score):
+    return int(round(score * 100)) if score is not None else NO_SCORE
 
-    conf = None
-    if hasattr(model, "predict_proba"):
-        try:
-            conf = float(model.predict_proba(x).max())
-        except:
-            conf = None
-    return pred, conf
+# backslash-escape every ASCII punctuation char so stored SMS text can't
+# inject headings, rules, emphasis, links or autolinked URLs
+_MD_ESCAPE = str.maketrans({c: "\\" + c for c in string.punctuation})
+
+def _md_text(msg):
+    # keep the SMS line breaks as hard breaks; stripping each line also
+    # stops leading spaces from turning into a code block
+    lines = (ln.strip().translate(_MD_ESCAPE) for ln in msg.splitlines())
+    return "  \n".join(ln for ln in lines if ln)
+
+if "history" not in st.session_state:
+    # parallel columns; scores are whole percents in one byte, 255 when
+    # there is none
+    st.session_state.history = {
+        "label": [],
+        "score": array.array("B"),
+        "message": [],
+        "time": [],
+        "clean": [],
+    }
 
 # ---------- UI ----------
 st.markdown("<h1 style='text-align:center;'>📨 SMS Spam Classifier</h1>", unsafe_allow_html=True)
@@ -68,21 +59,55 @@ if predict_btn:
     if not message.strip():
         st.error("Please enter a message.")
     else:
-        label, score = classify(message)
+        label, score = predict(message)
+        cleaned = clean_text(message)
+
+        # skip the insert when the same message was just predicted
+        history = st.session_state.history
+        if not history["clean"] or history["clean"][0] != cleaned:
+            history["label"].insert(0, label)
+            history["score"].insert(0, _pct(score))
+            history["message"].insert(0, message)
+            history["time"].insert(0, datetime.now().strftime("%H:%M:%S"))
+            history["clean"].insert(0, cleaned)
+            for k in history:
+                del history[k][10:]
 
         st.markdown("---")
         if label == "spam":
-            st.markdown(
+            primary = "#cc0000"
+            html = (
                 "<div style='padding:15px;border-radius:10px;background:#ffecec;border:1px solid #ffb3b3;'>"
-                "<h3 style='color:#cc0000;margin:0;'>🚫 SPAM</h3></div>",
-                unsafe_allow_html=True,
+                f"<h3 style='color:{primary};margin:0;'>🚫 SPAM</h3></div>"
             )
         else:
-            st.markdown(
+            primary = "#0f8a54"
+            html = (
                 "<div style='padding:15px;border-radius:10px;background:#e7fff4;border:1px solid #a8e8c9;'>"
-                "<h3 style='color:#0f8a54;margin:0;'>✅ NOT SPAM</h3></div>",
-                unsafe_allow_html=True,
+                f"<h3 style='color:{primary};margin:0;'>✅ NOT SPAM</h3></div>"
             )
 
+        # confidence text and a CSS-only bar ride along in the same markdown call
         if score is not None:
-            st.write(f"**Confidence:** {score * 100:.2f}%")
+            html += (
+                f"<p style='margin:10px 0 6px;'><b>Confidence:</b> {score * 100:.2f}%</p>"
+                "<div style='height:6px;background:#eee;border-radius:3px'>"
+                f"<div style='width:{score * 100:.0f}%;height:100%;background:{primary};border-radius:3px'></div></div>"
+            )
+
+        st.markdown(html, unsafe_allow_html=True)
+
+# ---------- History ----------
+history = st.session_state.history
+if history["clean"]:
+    st.markdown("---")
+    st.subheader("Recent predictions")
+    # one markdown blob -> one frontend delta for the whole list
+    st.markdown("\n\n---\n\n".join(
+        f"**{label.upper()}**"
+        + (f" — {score}%" if score != NO_SCORE else "")
+        + f" · {time}\n\n{_md_text(msg)}"
+        for label, score, msg, time in zip(
+            history["label"], history["score"], history["message"], history["time"]
+        )
+    ))
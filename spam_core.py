@@ -0,0 +1,118 @@
+# spam_core.py
+import streamlit as st
+import numbers
+import threading
+import warnings
+from functools import lru_cache
+
+# ---------- Safe load ----------
+@st.cache_resource
+def load_artifacts():
+    # imported here so the sklearn import graph pulled in by unpickling is
+    # paid once inside the cached loader, not on every script parse
+    import joblib
+
+    # both files are written with joblib.dump(obj, path, compress=0), so
+    # mmap_mode maps their numpy arrays (coef_, idf_) from disk instead of
+    # copying them into memory; re-dump the same way when retraining
+    try:
+        vectorizer = joblib.load("tfidf_vectorizer.pkl", mmap_mode="r")
+    except Exception as e:
+        return None, None, f"Error loading tfidf_vectorizer.pkl: {e}"
+
+    try:
+        model = joblib.load("spam_model.pkl", mmap_mode="r")
+    except Exception as e:
+        return None, None, f"Error loading spam_model.pkl: {e}"
+
+    return vectorizer, model, None
+
+# Runs one dummy prediction off the script thread so BLAS / scipy.sparse
+# init is done before the first real Predict; started once per process.
+@st.cache_resource
+def warm_up():
+    vectorizer, model, _ = load_artifacts()
+    t = threading.Thread(
+        target=lambda: model.predict(vectorizer.transform([""])),
+        daemon=True,
+    )
+    t.start()
+    return t
+
+# ---------- Helpers ----------
+@lru_cache(maxsize=64)
+def clean_text(text):
+    t = text if text.islower() else text.lower()
+    return " ".join(t.split())
+
+_LABEL_MAP = {
+    0: "ham", 1: "spam",
+    "0": "ham", "1": "spam",
+    "spam": "spam", "ham": "ham",
+    "true": "spam", "false": "ham",
+    "yes": "spam", "no": "ham",
+}
+
+def _label(pred):
+    # normalize type; numbers.Number also covers numpy scalars such as
+    # np.int64 / np.float32, which don't subclass int or float
+    if isinstance(pred, numbers.Number):
+        key = int(pred) if float(pred).is_integer() else None
+    else:
+        key = str(pred).lower()
+    label = _LABEL_MAP.get(key)
+    if label is None:
+        warnings.warn(f"Unrecognised model label {pred!r}; treating it as ham")
+        return "ham"
+    return label
+
+# Keyed on the cleaned text only; the model and vectorizer come from the
+# cached resources above, so repeated messages skip transform + inference.
+@st.cache_data(max_entries=512, show_spinner=False)
+def _predict_cached(cleaned):
+    vectorizer, model, _ = load_artifacts()
+    x = vectorizer.transform([cleaned])
+
+    # binary LogisticRegression: predict_proba is exactly expit of the
+    # decision function, so a single dot product + scalar sigmoid suffices.
+    # Other models (Platt-scaled SVC, modified_huber SGD) calibrate
+    # differently and keep the predict_proba path.
+    from sklearn.linear_model import LogisticRegression
+
+    use_df = isinstance(model, LogisticRegression) and len(model.classes_) == 2
+
+    conf = None
+    if use_df:
+        try:
+            from scipy.special import expit
+
+            z = float(model.decision_function(x)[0])
+            p = float(expit(z))
+            pred = model.classes_[int(z > 0)]
+            conf = p if z > 0 else 1 - p
+        except Exception:
+            conf = None
+    elif hasattr(model, "predict_proba"):
+        # one predict_proba pass gives both the label (argmax) and the confidence
+        try:
+            probs = model.predict_proba(x)[0]
+            idx = int(probs.argmax())
+            pred = model.classes_[idx]
+            conf = float(probs[idx])
+        except Exception:
+            conf = None
+    if conf is None:
+        pred = model.predict(x)[0]
+
+    return _label(pred), conf
+
+def predict(text):
+    cleaned = clean_text(text)
+    # a rerun with unchanged text returns the last result without even the
+    # st.cache_data key hashing and result unpickling
+    last = st.session_state.get("_last_pred")
+    if last and last[0] == cleaned:
+        return last[1]
+    result = _predict_cached(cleaned)
+    st.session_state["_last_pred"] = (cleaned, result)
+    return result